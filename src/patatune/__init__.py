@@ -3,7 +3,9 @@ A Python framework for Metaheuristic Multi-Objective Optimization
 """
 from .util import FileManager, Randomizer, Logger
 from .optimizer import Optimizer
-from .objective import Objective, ElementWiseObjective, BatchObjective, AsyncElementWiseObjective
+from .objective import Objective, ElementWiseObjective, BatchObjective, AsyncElementWiseObjective, ThreadedBatchObjective, ProcessBatchObjective
+from .jit import jit_objective, gu_objective
+from .aot import compile_objectives, AOTObjective
 from .mopso.mopso import MOPSO
 from . import metrics
 
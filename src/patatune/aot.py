@@ -0,0 +1,98 @@
+"""Ahead-of-time compilation of objective functions with numba.
+
+Functions compiled with [`jit_objective`][patatune.jit.jit_objective] are compiled at their first call,
+which can stall the first iteration of the optimization for several seconds.
+With [`compile_objectives`][patatune.aot.compile_objectives] the objective functions are instead compiled once,
+with an explicit signature, into an extension module that can be shipped and loaded with
+[`AOTObjective`][patatune.aot.AOTObjective] without any compilation at run time.
+
+For example, to compile the objective function:
+```python
+def f(params):
+    out = np.empty((len(params), 2))
+    for i in range(len(params)):
+        out[i, 0] = 4 * params[i, 0]**2 + 4 * params[i, 1]**2
+        out[i, 1] = (params[i, 0] - 5)**2 + (params[i, 1] - 5)**2
+    return out
+
+path = patatune.compile_objectives([f], module_name="binh_korn", output_dir="build")
+```
+and to use it in a later run:
+```python
+objective = patatune.Objective([patatune.AOTObjective(path, "f")], num_objectives=2)
+```
+
+The compilation uses `numba.pycc`, so numba and a C compiler are needed to compile the functions, but not to load them.
+"""
+
+import os
+import importlib.util
+from .util import Logger
+
+DEFAULT_SIGNATURE = 'f8[:,:](f8[:,:])'
+
+# Extension modules loaded by AOTObjective, keyed by their absolute path
+_modules = {}
+
+
+def compile_objectives(functions, module_name='patatune_objectives', output_dir='.', signature=DEFAULT_SIGNATURE):
+    """Compile objective functions ahead of time into an extension module.
+
+    Each function is exported in the module with its own name.
+
+    Args:
+        functions (list[callable]): Objective functions to compile. They receive a 2D `float64` array of shape
+            `(num_particles, num_parameters)` and must be compilable by numba in nopython mode.
+        module_name (str): Name of the extension module.
+        output_dir (str): Directory where the extension module is written.
+        signature (str): Numba signature used for all the functions.
+
+    Returns:
+        (str): Path to the compiled extension module.
+    """
+    from numba.pycc import CC
+
+    cc = CC(module_name)
+    cc.output_dir = output_dir
+    for function in functions:
+        function = getattr(function, "py_func", function)
+        cc.export(function.__name__, signature)(function)
+    Logger.debug("Compiling objective functions into '%s'", os.path.join(output_dir, cc.output_file))
+    cc.compile()
+    return os.path.join(output_dir, cc.output_file)
+
+
+class AOTObjective:
+    """Objective function loaded from an extension module compiled ahead of time.
+
+    [`Objective.evaluate`][patatune.objective.Objective.evaluate] passes instances of this class
+    a contiguous 2D `float64` array, as expected by the compiled signature.
+    Only the path and the name of the function are pickled, the module is loaded again when unpickling.
+
+    Attributes:
+        path (str): Path to the extension module.
+        name (str): Name of the exported function.
+    """
+    def __init__(self, path, name):
+        self.path = os.path.abspath(path)
+        self.name = name
+        module = _modules.get(self.path)
+        if module is None:
+            if not os.path.exists(self.path):
+                raise FileNotFoundError(f"The file '{self.path}' does not exist.")
+            Logger.debug("Loading compiled objectives from '%s'", self.path)
+            module_name = os.path.basename(self.path).split('.')[0]
+            spec = importlib.util.spec_from_file_location(module_name, self.path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _modules[self.path] = module
+        self._function = getattr(module, name)
+
+    def __call__(self, params):
+        return self._function(params)
+
+    def __getstate__(self):
+        return {'path': self.path, 'name': self.name}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['name'])
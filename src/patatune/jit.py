@@ -0,0 +1,124 @@
+"""Helpers to compile objective functions with numba.
+
+The [`jit_objective`][patatune.jit.jit_objective] function wraps a user objective with
+[numba](https://numba.pydata.org/) `njit`, so that the loop over the particles runs as a compiled
+(and possibly parallel) kernel.
+[`Objective.evaluate`][patatune.objective.Objective.evaluate] detects compiled functions and passes them
+a contiguous `float64` array instead of a list of positions.
+
+The [`gu_objective`][patatune.jit.gu_objective] decorator instead compiles a function evaluating a single particle
+into a parallel generalized ufunc, that [`ElementWiseObjective.evaluate`][patatune.objective.ElementWiseObjective.evaluate]
+calls once on all the particles.
+
+The import of numba is optional: if it is not installed the functions passed to `jit_objective` are returned unchanged,
+while `gu_objective` raises an `ImportError`.
+"""
+
+import numpy as np
+from .util import Logger
+
+try:
+    import numba
+    numba_available = True
+except ImportError:
+    numba_available = False
+
+
+def jit_objective(fn=None, signature=None, cache=True):
+    """Compile an objective function with `numba.njit(cache=cache, parallel=True)`.
+
+    Can be used both as a function and as a decorator:
+    ```python
+    @patatune.jit_objective
+    def f(params):
+        out = np.empty((len(params), 2))
+        for i in numba.prange(len(params)):
+            out[i, 0] = 4 * params[i, 0]**2 + 4 * params[i, 1]**2
+            out[i, 1] = (params[i, 0] - 5)**2 + (params[i, 1] - 5)**2
+        return out
+    ```
+
+    The compiled function receives a 2D `float64` array of shape `(num_particles, num_parameters)`.
+    The compilation happens at the first call and, if `cache` is True, is cached on disk for the following runs.
+
+    Args:
+        fn (callable, optional): The objective function to compile.
+        signature (str, optional): Explicit numba signature (e.g. `'f8[:,:](f8[:,:])'`).
+            If given, the function is compiled eagerly at decoration time.
+        cache (bool): Whether to cache the compiled function on disk. Must be False for functions
+            that are not defined in a file, e.g. in `python -c` or an interactive session.
+
+    Returns:
+        (callable): The compiled function, or `fn` itself if numba is not installed.
+    """
+    if fn is None:
+        return lambda f: jit_objective(f, signature, cache)
+    if not numba_available:
+        Logger.warning("numba package is not installed. Objective function %s will not be compiled.", fn)
+        return fn
+    if signature is None:
+        return numba.njit(fn, cache=cache, parallel=True)
+    return numba.njit(signature, cache=cache, parallel=True)(fn)
+
+
+def is_jitted(fn):
+    """Check whether a function has been compiled by numba.
+
+    Args:
+        fn (callable): The function to check.
+
+    Returns:
+        (bool): True if `fn` is a numba dispatcher.
+    """
+    return hasattr(fn, "__numba__")
+
+
+def gu_objective(signature, layout):
+    """Compile an element-wise objective function into a parallel generalized ufunc.
+
+    The function receives the position of a single particle and writes its objective value in `out[0]`.
+    Numba generates the loop over the particles and runs it in parallel:
+    ```python
+    @patatune.gu_objective('void(f8[:], f8[:])', '(n)->()')
+    def f1(x, out):
+        out[0] = x[0]
+
+    @patatune.gu_objective('void(f8[:], f8[:])', '(n)->()')
+    def f2(x, out):
+        g = 1 + 9.0 / (len(x) - 1) * np.sum(x[1:])
+        out[0] = g * (1.0 - np.sqrt(x[0] / g))
+
+    objective = patatune.ElementWiseObjective([f1, f2])
+    ```
+
+    Numba does not allow output dimensions that do not appear in the inputs, so functions returning `k` values
+    need an input carrying that dimension (e.g. `'(n),(k)->(k)'`) and cannot be used directly by
+    [`ElementWiseObjective`][patatune.objective.ElementWiseObjective]: define one function per objective instead.
+
+    Args:
+        signature (str): Numba signature of the function, e.g. `'void(f8[:], f8[:])'`.
+        layout (str): Layout of the generalized ufunc, e.g. `'(n)->()'`.
+
+    Returns:
+        (callable): A decorator compiling the function.
+
+    Raises:
+        ImportError: If numba is not installed.
+    """
+    if not numba_available:
+        raise ImportError("numba package is required to compile generalized ufunc objectives.")
+    return numba.guvectorize([signature], layout, nopython=True, target='parallel')
+
+
+def is_gufunc(fn):
+    """Check whether a function is a generalized ufunc, e.g. compiled by `numba.guvectorize`.
+
+    Args:
+        fn (callable): The function to check.
+
+    Returns:
+        (bool): True if `fn` is a generalized ufunc.
+    """
+    if isinstance(fn, np.ufunc):
+        return fn.signature is not None
+    return hasattr(fn, "gufunc_builder")
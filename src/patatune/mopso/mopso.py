@@ -42,6 +42,20 @@ def _truncated_normal_sample(lower, upper, loc, scale_factor, max_attempts=1000)
     return samples
 
 
+class HistoryEntry(dict):
+    """Entry of the MOPSO history, mapping each field to an array with one row per particle.
+
+    The fields are `id`, `position` and `fitness` for the iterations, and `position` and `fitness` for the Pareto front.
+    """
+    def to_dicts(self):
+        """Returns the entry as a list with one dictionary per particle, as in the previous record layout of the history.
+
+        Returns:
+            (list[dict]): For each particle, a dictionary mapping each field to its value.
+        """
+        return [dict(zip(self.keys(), values)) for values in zip(*self.values())]
+
+
 class MOPSO(Optimizer):
     """ Multi-Objective Particle Swarm Optimization (MOPSO) algorithm.  
     
@@ -250,6 +264,10 @@ class MOPSO(Optimizer):
         Logger.debug("Loading checkpoint")
         obj = FileManager.load_pickle("checkpoint/mopso.pkl")
         self.__dict__ = obj.__dict__
+        # Checkpoints of previous versions store the history entries as structured arrays
+        for key, entry in self.history.items():
+            if isinstance(entry, np.ndarray) and entry.dtype.names is not None:
+                self.history[key] = HistoryEntry({name: entry[name] for name in entry.dtype.names})
 
     def step(self, max_iterations_without_improvement=None):
         """Performs a single optimization step in the MOPSO algorithm.
@@ -263,18 +281,21 @@ class MOPSO(Optimizer):
             [particle.position for particle in self.particles])
         [particle.set_fitness(optimization_output[p_id])
             for p_id, particle in enumerate(self.particles)]
-        FileManager.save_csv([np.concatenate([particle.position, np.ravel(
-            particle.fitness * self.objective.directions)]) for particle in self.particles],
+        directions = np.asarray(self.objective.directions, dtype=float)
+        positions = np.array([particle.position for particle in self.particles], dtype=float)
+        fitness = np.asarray(optimization_output, dtype=float) * directions
+        FileManager.save_csv(np.hstack([positions, fitness]),
             'history/iteration' + str(self.iteration) + '.csv',
             headers=self.param_names + self.objective.objective_names)
-        self.history[self.iteration] = np.array(
-            [(particle.id, particle.position, particle.fitness * self.objective.directions) for particle in self.particles],
-            dtype=np.dtype([('id', int), ('position', float, (self.num_params,)), ('fitness', float, (self.objective.num_objectives,))])
+        self.history[self.iteration] = HistoryEntry(
+            id=np.array([particle.id for particle in self.particles], dtype=int),
+            position=positions,
+            fitness=fitness,
         )
         crowding_distances = self.update_pareto_front()
-        self.history['pareto_front'] = np.array(
-            [(particle.position, particle.fitness * self.objective.directions) for particle in self.pareto_front],
-            dtype=[('position', float, (self.num_params,)), ('fitness', float, (self.objective.num_objectives,))]
+        self.history['pareto_front'] = HistoryEntry(
+            position=np.array([particle.position for particle in self.pareto_front], dtype=float).reshape(-1, self.num_params),
+            fitness=np.array([particle.fitness for particle in self.pareto_front], dtype=float).reshape(-1, self.objective.num_objectives) * directions,
         )
         for particle in self.particles:
             particle.update_velocity(self.pareto_front,
@@ -4,8 +4,72 @@ Provides a base [`Objective`][patatune.objective.Objective] and concrete impleme
 element-wise, batched and asynchronous evaluations.
 """
 
+import math
 import numpy as np
 import asyncio
+import weakref
+import functools
+import dill
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from .jit import is_jitted, is_gufunc
+from .aot import AOTObjective
+
+# If uvloop is installed use it as the event loop of the asynchronous objectives
+try:
+    import uvloop
+    uvloop_available = True
+except ImportError:
+    uvloop_available = False
+
+def _split_batches(items, batch_size):
+    """Splits the items in ``ceil(len(items) / batch_size)`` views of (almost) equal size."""
+    num_batches = max(1, math.ceil(len(items) / batch_size))
+    return np.array_split(np.asarray(items), num_batches)
+
+
+# Objective functions of the ProcessBatchObjective served by a worker process, set by _init_worker
+_worker_functions = []
+
+
+def _init_worker(payloads):
+    """Unpickles the objective functions of a ProcessBatchObjective once in each worker process."""
+    global _worker_functions
+    _worker_functions = [dill.loads(payload) for payload in payloads]
+
+
+def _call_worker_function(index, batch):
+    """Calls the objective function of index `index` on a batch, in a worker process."""
+    return _worker_functions[index](batch)
+
+
+def _generate_evaluate(objective_functions, compiled, directions):
+    """Generates an evaluation function specialized for a list of objective functions.
+
+    The calls to the objective functions are unrolled in the source of the generated function,
+    which stacks their results, each of shape ``(num_particles,)``, and applies the directions.
+
+    Args:
+        objective_functions (list): The objective functions to call.
+        compiled (list[bool]): For each objective function, whether it expects a contiguous `float64` array.
+        directions (np.ndarray): The directions of the objectives.
+
+    Returns:
+        (callable): A function taking the items and returning an array of shape (num_particles, num_objectives).
+    """
+    namespace = {'np': np, 'directions': directions}
+    lines = ['def evaluate(items):']
+    if any(compiled):
+        lines.append('    array_items = np.ascontiguousarray(items, dtype=np.float64)')
+    for i, (objective_function, is_compiled) in enumerate(zip(objective_functions, compiled)):
+        namespace[f'f{i}'] = objective_function
+        lines.append(f'    r{i} = f{i}({"array_items" if is_compiled else "items"})')
+    results = ''.join(f'r{i}, ' for i in range(len(objective_functions)))
+    lines.append(f'    solutions = np.stack(({results}), axis=1).astype(np.float64, copy=False)')
+    lines.append('    solutions *= directions')
+    lines.append('    return solutions')
+    exec('\n'.join(lines), namespace)
+    return namespace['evaluate']
+
 
 class Objective():
     """Base class for defining objective functions.
@@ -23,6 +87,9 @@ class Objective():
         objective_names (list[str], optional): Names for each objective.
         true_pareto (callable, optional): Function that returns the true Pareto front. Takes as input
             the number of points and returns a 2D array of shape `(num_points, num_objectives)`.
+
+    Objective functions compiled with [`jit_objective`][patatune.jit.jit_objective] (or any numba `njit`)
+    and [`AOTObjective`][patatune.aot.AOTObjective] functions receive the items as a contiguous 2D `float64` array.
     """
     def __init__(self, objective_functions, num_objectives=None, directions=None, objective_names=None ,true_pareto=None) -> None:
         if not isinstance(objective_functions, list):
@@ -57,9 +124,30 @@ class Objective():
             self.objective_names = objective_names
 
         self.true_pareto = true_pareto
+        self._init_caches()
+
+    def _init_caches(self):
+        """Computes the attributes derived from the objective functions and the directions.
+
+        Called by `__init__` and when loading a checkpoint, so that objectives pickled
+        before these attributes existed can still be evaluated.
+        """
+        self._n_obj = len(self.objective_functions)
+        self._compiled = [is_jitted(f) or isinstance(f, AOTObjective) for f in self.objective_functions]
+        self._any_compiled = any(self._compiled)
+        self._directions_arr = np.asarray(self.directions, dtype=np.float64)
+        self._result_layout = None
+        self._flat_results = False
+        self._fast_evaluate = None
 
     def evaluate(self, items):
         """Passes all items to each objective function and collects the results.
+
+        Each objective function must return an array of shape ``(num_particles,)`` or
+        ``(num_particles, k)``; the results are written side by side in the output array.
+        The number of dimensions of each result is recorded at the first call: if every objective function
+        returns one value per particle, the following calls are run by a function generated for the exact number
+        of objective functions, that calls each of them and stacks the results without any loop.
         
         Args:
             items (list): List of parameter sets to evaluate with shape ``(num_particles, num_parameters)``.
@@ -67,16 +155,102 @@ class Objective():
         Returns:
             (np.ndarray): Array of shape (num_particles, num_objectives) with evaluated objective values.
         """
-        result = [objective_function(items)
-                  for objective_function in self.objective_functions]
-        solutions = []
+        if self._flat_results:
+            if self._fast_evaluate is None:
+                self._fast_evaluate = _generate_evaluate(self.objective_functions, self._compiled, self._directions_arr)
+            return self._fast_evaluate(items)
+        if self._n_obj == 0:
+            return np.empty((len(items), 0), dtype=np.float64)
+        array_items = np.ascontiguousarray(items, dtype=np.float64) if self._any_compiled else None
+        result = [objective_function(array_items if compiled else items)
+                  for objective_function, compiled in zip(self.objective_functions, self._compiled)]
+        if self._result_layout is None:
+            self._result_layout = tuple(np.ndim(r) for r in result)
+            self._flat_results = self._result_layout == (1,) * self.num_objectives
+        return self._collect_solutions(result, len(items))
+
+    def _collect_solutions(self, result, num_items):
+        """Writes the results of the objective functions side by side and applies the directions.
+
+        Each result is converted once with `np.asarray` and copied as a block of columns of the output,
+        so the per-item results of element-wise objectives need no transposition.
+
+        Args:
+            result (list): One array-like per objective function, of shape ``(num_particles,)`` or ``(num_particles, k)``.
+            num_items (int): Number of evaluated items.
+
+        Returns:
+            (np.ndarray): Array of shape (num_particles, num_objectives).
+        """
+        solutions = np.empty((num_items, self.num_objectives), dtype=np.float64)
+        start = 0
         for r in result:
-            if len(np.shape(r)) > 1:
-                for sub_r in r:
-                    solutions.append(sub_r)
-            else:
-                solutions.append(r)
-        return np.array(solutions) * self.directions
+            start += self._write_block(solutions, slice(None), start, r)
+        return self._apply_directions(solutions, start)
+
+    def _fill_batches(self, outputs, offsets):
+        """Copies the batch outputs of each objective function into a preallocated result.
+
+        Args:
+            outputs (list): For each objective function, an iterable with the output of each batch,
+                of shape ``(batch_length,)`` or ``(batch_length, k)``.
+            offsets (np.ndarray): Row offsets of the batches, with one more element than the number of batches.
+
+        Returns:
+            (np.ndarray): Array of shape (num_particles, num_objectives).
+        """
+        solutions = np.empty((offsets[-1], self.num_objectives), dtype=np.float64)
+        start = 0
+        for output in outputs:
+            width = None
+            for k, out in enumerate(output):
+                batch_width = self._write_block(solutions, slice(offsets[k], offsets[k + 1]), start, out)
+                if width is not None and batch_width != width:
+                    raise ValueError(
+                        f"Objective function returned {batch_width} values for batch {k}, but {width} for the previous batches.")
+                width = batch_width
+            start += width
+        return self._apply_directions(solutions, start)
+
+    def _write_block(self, solutions, rows, start, out):
+        """Writes the output of an objective function in the columns of the solutions starting at `start`.
+
+        Args:
+            solutions (np.ndarray): Array of shape (num_particles, num_objectives) being filled.
+            rows (slice): Rows of the solutions corresponding to the output.
+            start (int): First column to write.
+            out (array-like): Output of shape ``(num_rows,)`` or ``(num_rows, k)``.
+
+        Returns:
+            (int): Number of columns written.
+        """
+        out = np.asarray(out, dtype=np.float64)
+        width = out.shape[1] if out.ndim > 1 else 1
+        if start + width > self.num_objectives:
+            raise ValueError(
+                f"Objective functions returned more values than the number of objectives ({self.num_objectives}).")
+        if out.ndim > 1:
+            solutions[rows, start:start + width] = out
+        else:
+            solutions[rows, start] = out
+        return width
+
+    def _apply_directions(self, solutions, num_values):
+        """Checks that all the objectives were written and applies the directions in place."""
+        if num_values != self.num_objectives:
+            raise ValueError(
+                f"Objective functions returned {num_values} values, expected {self.num_objectives}.")
+        solutions *= self._directions_arr
+        return solutions
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_fast_evaluate'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_caches()
 
     def type(self):
         return self.__class__.__name__
@@ -87,29 +261,112 @@ class ElementWiseObjective(Objective):
     
     Inherits from the base Objective class and implements the evaluate method
     to evaluate each objective function on individual items.
+
+    Attributes:
+        vectorized (bool): If True, each objective function is called once on the whole
+            array of items of shape ``(num_particles, num_parameters)`` and must return an array
+            of shape ``(num_particles,)`` or ``(num_particles, k)``, skipping the per-item loop.
     """
+    vectorized = False
+
+    def __init__(self, objective_functions, num_objectives=None, directions=None, objective_names=None, true_pareto=None, vectorized=False):
+        super().__init__(objective_functions, num_objectives, directions, objective_names, true_pareto)
+        self.vectorized = vectorized
+
+    def _init_caches(self):
+        super()._init_caches()
+        self._gufuncs = [is_gufunc(f) for f in self.objective_functions]
+        self._any_gufunc = any(self._gufuncs)
+
     def evaluate(self, items):
         """Passes each item one by one to each objective function and collects the results.
 
+        If `vectorized` is True, all items are passed at once to each objective function instead.
+        Generalized ufuncs (see [`gu_objective`][patatune.jit.gu_objective]) are always called once
+        on the contiguous `float64` array of all the items, and loop over the items in compiled code.
+
         Args:
             items (list): List of parameter sets to evaluate of shape (num_particles, num_parameters).
 
         Returns:
             (np.ndarray): Array of shape (num_particles, num_objectives) with evaluated objective values.
         """
-        result = [[obj_func(item) for item in items]
-                  for obj_func in self.objective_functions]
-        solutions = []
-        for r in result:
-            if len(np.shape(r)) > 1:
-                for sub_r in (np.array(r).T):
-                    solutions.append(sub_r)
-            else:
-                solutions.append(r)
-        solutions = np.array(solutions).T * self.directions
-        return solutions
+        array_items = np.ascontiguousarray(items, dtype=np.float64) if self._any_gufunc else None
+        if self.vectorized:
+            items = np.asarray(items)
+            return self._collect_solutions([obj_func(array_items if gufunc else items)
+                                            for obj_func, gufunc in zip(self.objective_functions, self._gufuncs)],
+                                           len(items))
+        return self._collect_solutions([obj_func(array_items) if gufunc else [obj_func(item) for item in items]
+                                        for obj_func, gufunc in zip(self.objective_functions, self._gufuncs)],
+                                       len(items))
+
+class _AsyncObjective(Objective):
+    """Base class for the objectives evaluated with asynchronous objective functions.
+
+    Checks that all the objective functions are coroutine functions and keeps a single event loop,
+    created at the first evaluation and reused by all the following ones.
+    If [uvloop](https://github.com/MagicStack/uvloop) is installed, the event loop is a uvloop one.
+    The event loop is closed by [`close`][patatune.objective._AsyncObjective.close] or when the objective is garbage collected.
+    It is not pickled: a new one is created after loading a checkpoint.
+
+    Attributes:
+        max_concurrency (int): Maximum number of objective function calls running at the same time.
+            If None, all the calls are started at once.
+    """
+    max_concurrency = None
+    _loop = None
+    _loop_finalizer = None
+
+    def __init__(self, objective_functions, num_objectives=None, directions=None, objective_names=None, true_pareto=None, max_concurrency=None):
+        super().__init__(objective_functions, num_objectives, directions, objective_names, true_pareto)
+        for obj_func in self.objective_functions:
+            if not asyncio.iscoroutinefunction(obj_func):
+                raise ValueError(f"Objective function {obj_func} must be asynchronous for {self.type()}.")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be a positive integer, got {max_concurrency}.")
+        self.max_concurrency = max_concurrency
+
+    def _run(self, coroutine):
+        if self._loop is None or self._loop.is_closed():
+            self._loop = uvloop.new_event_loop() if uvloop_available else asyncio.new_event_loop()
+            self._loop_finalizer = weakref.finalize(self, self._loop.close)
+        return self._loop.run_until_complete(coroutine)
+
+    def _semaphore(self):
+        if self.max_concurrency is None:
+            return None
+        return asyncio.Semaphore(self.max_concurrency)
+
+    def _split_outputs(self, outputs, num_tasks):
+        """Splits the flat list of outputs of all the objective functions into one list per function."""
+        return [outputs[j * num_tasks:(j + 1) * num_tasks] for j in range(self._n_obj)]
+
+    @staticmethod
+    def _limit(coroutine, semaphore):
+        if semaphore is None:
+            return coroutine
+
+        async def guarded():
+            async with semaphore:
+                return await coroutine
+        return guarded()
 
-class BatchObjective(Objective):
+    def close(self):
+        """Closes the event loop used to run the objective functions."""
+        if self._loop_finalizer is not None:
+            self._loop_finalizer()
+        self._loop = None
+        self._loop_finalizer = None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_loop'] = None
+        state['_loop_finalizer'] = None
+        return state
+
+
+class BatchObjective(_AsyncObjective):
     """Batch objective class.
 
     Inherits from the base Objective class and implements the evaluate method
@@ -119,60 +376,149 @@ class BatchObjective(Objective):
      Attributes:
         batch_size (int): Size of each batch for evaluation.
     """
-    def __init__(self, objective_functions, batch_size, num_objectives=None, directions=None, objective_names=None, true_pareto=None):
-        super().__init__(objective_functions, num_objectives, directions, objective_names, true_pareto)
+    def __init__(self, objective_functions, batch_size, num_objectives=None, directions=None, objective_names=None, true_pareto=None, max_concurrency=None):
+        super().__init__(objective_functions, num_objectives, directions, objective_names, true_pareto, max_concurrency)
         self.batch_size = batch_size
 
-    async def _async_evaluate(self, obj_func, batches):
-        if not asyncio.iscoroutinefunction(obj_func):
-            raise ValueError(f"Objective function {obj_func} must be asynchronous for BatchObjective.")
-        tasks = [obj_func(batch) for batch in batches]
-        return await asyncio.gather(*tasks)
+    async def _async_evaluate(self, batches):
+        semaphore = self._semaphore()
+        tasks = [self._limit(obj_func(batch), semaphore)
+                 for obj_func in self.objective_functions for batch in batches]
+        return self._split_outputs(await asyncio.gather(*tasks), len(batches))
 
     def evaluate(self, items):
         """Passes items in batches to each objective function asynchronously and collects the results.
 
+        The items are split into ``ceil(num_particles / batch_size)`` batches of (almost) equal size,
+        each one being a view of the items array with at most `batch_size` rows.
+        The calls of all the objective functions on all the batches are gathered at once in the event loop
+        of the objective, and the output of each batch is copied directly into its rows of the result.
+
         Args:
             items (list): List of parameter sets to evaluate of shape (num_particles, num_parameters).
 
         Returns:
             (np.ndarray): Array of shape (num_particles, num_objectives) with evaluated objective values.
         """
-        if len(items) % self.batch_size == 0:
-            batches = [items[i:i + self.batch_size]
-                       for i in range(0, len(items), self.batch_size)]
-        else:
-            batches = [items[i:i + self.batch_size]
-                       for i in range(0, len(items) - len(items) % self.batch_size, self.batch_size)]
-            batches.append(items[len(items) - len(items) % self.batch_size:])
-        
-        result = []
-        for obj_func in self.objective_functions:
-            if not asyncio.iscoroutinefunction(obj_func):
-                raise ValueError("All objective functions must be asynchronous for BatchObjective.")
-            tasks_output = asyncio.run(self._async_evaluate(obj_func, batches))
-            result.append(np.concatenate(tasks_output))
+        batches = _split_batches(items, self.batch_size)
+        offsets = np.cumsum([0] + [len(batch) for batch in batches])
 
-        solutions = []
-        for r in result:
-            if len(np.shape(r)) > 1:
-                for sub_r in r:
-                    solutions.append(sub_r)
-            else:
-                solutions.append(r)
-        return np.array(solutions) * self.directions
-
-class AsyncElementWiseObjective(Objective):
+        tasks_output = self._run(self._async_evaluate(batches))
+        return self._fill_batches(tasks_output, offsets)
+
+
+class _PoolBatchObjective(Objective):
+    """Base class for the batch objectives evaluated by a `concurrent.futures` executor.
+
+    The executor is created at the first evaluation and reused by all the following ones.
+    It is shut down by [`close`][patatune.objective._PoolBatchObjective.close] or when the objective is garbage collected,
+    and it is not pickled: a new one is created after loading a checkpoint.
+
+    Attributes:
+        batch_size (int): Size of each batch for evaluation.
+        max_workers (int): Maximum number of workers of the executor. If None, the executor default is used.
+    """
+    _executor_class = None
+    max_workers = None
+    _pool = None
+    _pool_finalizer = None
+
+    def __init__(self, objective_functions, batch_size, num_objectives=None, directions=None, objective_names=None, true_pareto=None, max_workers=None):
+        super().__init__(objective_functions, num_objectives, directions, objective_names, true_pareto)
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+
+    def _init_caches(self):
+        super()._init_caches()
+        self._tasks = list(self.objective_functions)
+
+    def _executor_options(self):
+        """Returns the additional keyword arguments used to create the executor."""
+        return {}
+
+    def _executor(self):
+        if self._pool is None:
+            self._pool = self._executor_class(max_workers=self.max_workers, **self._executor_options())
+            self._pool_finalizer = weakref.finalize(self, self._pool.shutdown)
+        return self._pool
+
+    def close(self):
+        """Shuts down the executor used to run the objective functions."""
+        if self._pool_finalizer is not None:
+            self._pool_finalizer()
+        self._pool = None
+        self._pool_finalizer = None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_pool'] = None
+        state['_pool_finalizer'] = None
+        return state
+
+    def evaluate(self, items):
+        """Passes items in batches to each objective function through the executor and collects the results.
+
+        The items are split into ``ceil(num_particles / batch_size)`` batches of (almost) equal size.
+        All the batches of all the objective functions are submitted to the executor before collecting any result.
+
+        Args:
+            items (list): List of parameter sets to evaluate of shape (num_particles, num_parameters).
+
+        Returns:
+            (np.ndarray): Array of shape (num_particles, num_objectives) with evaluated objective values.
+        """
+        batches = _split_batches(items, self.batch_size)
+        offsets = np.cumsum([0] + [len(batch) for batch in batches])
+        pool = self._executor()
+        outputs = [pool.map(task, batches) for task in self._tasks]
+        return self._fill_batches(outputs, offsets)
+
+
+class ThreadedBatchObjective(_PoolBatchObjective):
+    """Batch objective class evaluated by a pool of threads.
+
+    Inherits from the base Objective class and implements the evaluate method
+    to evaluate each objective function on batches of items in a `ThreadPoolExecutor`.
+    Useful for synchronous objective functions that release the GIL, e.g. NumPy or numba `nogil` code,
+    or that wait on external resources.
+    """
+    _executor_class = ThreadPoolExecutor
+
+
+class ProcessBatchObjective(_PoolBatchObjective):
+    """Batch objective class evaluated by a pool of processes.
+
+    Inherits from the base Objective class and implements the evaluate method
+    to evaluate each objective function on batches of items in a `ProcessPoolExecutor`,
+    running CPU-bound pure Python objective functions on multiple cores.
+    The objective functions are pickled with dill and unpickled once by each worker when the executor is created,
+    so functions defined in `__main__` are sent by value and keep working after loading a checkpoint.
+    Only the index of the function and the batch are sent with each call.
+    """
+    _executor_class = ProcessPoolExecutor
+
+    def _init_caches(self):
+        super()._init_caches()
+        self._tasks = [functools.partial(_call_worker_function, index) for index in range(self._n_obj)]
+
+    def _executor_options(self):
+        payloads = [dill.dumps(obj_func, recurse=True) for obj_func in self.objective_functions]
+        return {'initializer': _init_worker, 'initargs': (payloads,)}
+
+
+class AsyncElementWiseObjective(_AsyncObjective):
     """Asynchronous element-wise objective class.
     """
-    async def _async_evaluate(self, obj_func, items):
-        if not asyncio.iscoroutinefunction(obj_func):
-            raise ValueError(f"Objective function {obj_func} must be asynchronous.")
-        tasks = [obj_func(item) for item in items]
-        return await asyncio.gather(*tasks)
+    async def _async_evaluate(self, items):
+        semaphore = self._semaphore()
+        tasks = [self._limit(obj_func(item), semaphore)
+                 for obj_func in self.objective_functions for item in items]
+        return self._split_outputs(await asyncio.gather(*tasks), len(items))
 
     def evaluate(self, items):
         """Passes each item one by one to each asynchronous objective function and collects the results.
+
+        All the objective functions are evaluated on all the items concurrently within the event loop of the objective.
         
         Args:
             items (list): List of parameter sets to evaluate of shape (num_particles, num_parameters).
@@ -180,16 +526,5 @@ class AsyncElementWiseObjective(Objective):
         Returns:
             (np.ndarray): Array of shape (num_particles, num_objectives) with evaluated objective values.
         """
-        result = []
-        for obj_func in self.objective_functions:
-            tasks_output = asyncio.run(self._async_evaluate(obj_func, items))
-            result.append(np.array(tasks_output))
-        solutions = []
-        for r in result:
-            if len(np.shape(r)) > 1:
-                for sub_r in (np.array(r).T):
-                    solutions.append(sub_r)
-            else:
-                solutions.append(r)
-        solutions = np.array(solutions).T * self.directions
-        return solutions
\ No newline at end of file
+        tasks_output = self._run(self._async_evaluate(items))
+        return self._collect_solutions(tasks_output, len(items))
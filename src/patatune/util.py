@@ -174,7 +174,7 @@ class FileManager:
             Logger.debug("Creating folder '%s'", folder)
             os.makedirs(folder)
         Logger.debug("Saving to '%s'", full_path)
-        arr = np.array(csv_list, dtype=float)
+        arr = np.asarray(csv_list, dtype=float)
         if cls.headers_enabled and headers is not None:
             with open(full_path, 'w') as f:
                 f.write(','.join(headers) + '\n')
@@ -298,6 +298,8 @@ class FileManager:
         It creates the necessary directories if they do not exist.
         The keys of the dictionary are used as group names in the Zarr file.
         If a key is an integer, it is prefixed with "iteration_" to form the group name.
+        If a value is itself a dictionary of arrays, each array is saved as a separate dataset of the group,
+        otherwise the value is saved in a dataset named "data".
         Additional attributes can be added to the root group via `kwargs`.
 
         Args:
@@ -328,7 +330,11 @@ class FileManager:
                 group_name = key
             
             group = root_group.create_group(group_name)
-            group.create_dataset("data", data=value, overwrite=True)
+            if isinstance(value, dict):
+                for name, data in value.items():
+                    group.create_dataset(name, data=data, overwrite=True)
+            else:
+                group.create_dataset("data", data=value, overwrite=True)
         root_group.attrs.update(kwargs)
                 
         store.close()
@@ -0,0 +1,48 @@
+import patatune
+import numpy as np
+import matplotlib.pyplot as plt
+import dill
+
+
+lb = [0.0, 0.0]
+ub = [5.0, 3.0]
+
+num_agents = 100
+num_iterations = 100
+num_params = 2
+
+
+def f(params):
+    out = np.empty((len(params), 2))
+    for i in range(len(params)):
+        out[i, 0] = 4 * params[i, 0]**2 + 4 * params[i, 1]**2
+        out[i, 1] = (params[i, 0] - 5)**2 + (params[i, 1] - 5)**2
+    return out
+
+
+patatune.FileManager.working_dir = "tmp/aot_binh_korn"
+patatune.Logger.setLevel('DEBUG')
+
+# compile the objective function once into an extension module, that can be loaded without numba
+path = patatune.compile_objectives([f], module_name="aot_binh_korn", output_dir="tmp/aot_binh_korn/build")
+aot_f = patatune.AOTObjective(path, "f")
+
+# only the path and the name of the function are pickled in the checkpoints
+aot_f = dill.loads(dill.dumps(aot_f))
+
+objective = patatune.Objective([aot_f], num_objectives=2, objective_names=['f1', 'f2'])
+
+pso = patatune.MOPSO(objective=objective, lower_bounds=lb, upper_bounds=ub,
+                      num_particles=num_agents,
+                      inertia_weight=0.5, cognitive_coefficient=1, social_coefficient=1,
+                      initial_particles_position='random', max_pareto_length=100)
+
+# run the optimization algorithm
+pso.optimize(num_iterations)
+
+pareto_x = [particle.fitness[0] for particle in pso.pareto_front]
+pareto_y = [particle.fitness[1] for particle in pso.pareto_front]
+plt.scatter(pareto_x, pareto_y, s=5)
+plt.xlim(0, 140)
+plt.ylim(0, 70)
+plt.savefig('tmp/aot_binh_korn/checkpoint/pf.png')
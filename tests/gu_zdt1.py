@@ -0,0 +1,49 @@
+import patatune
+import numpy as np
+import matplotlib.pyplot as plt
+import os
+
+num_agents = 100
+num_iterations = 100
+num_params = 30
+
+lb = [0.] * num_params
+ub = [1.] * num_params
+
+
+@patatune.gu_objective('void(f8[:], f8[:])', '(n)->()')
+def f1(x, out):
+    out[0] = x[0]
+
+
+def f2(x):
+    g = 1 + 9.0 / (len(x) - 1) * np.sum(x[1:])
+    return g * (1.0 - np.sqrt(x[0] / g))
+
+
+patatune.Randomizer.rng = np.random.default_rng(46)
+patatune.FileManager.working_dir = "tmp/gu_zdt1/"
+
+# f1 is evaluated on all the particles at once, f2 on each particle
+objective = patatune.ElementWiseObjective([f1, f2], objective_names=['f1', 'f2'])
+pso = patatune.MOPSO(objective=objective, lower_bounds=lb, upper_bounds=ub,
+                      num_particles=num_agents,
+                      inertia_weight=1, cognitive_coefficient=1, social_coefficient=2,
+                      initial_particles_position='random', max_pareto_length=100)
+
+# run the optimization algorithm
+pso.optimize(num_iterations)
+
+print(len(pso.pareto_front))
+
+pareto_x = [particle.fitness[0] for particle in pso.pareto_front]
+pareto_y = [particle.fitness[1] for particle in pso.pareto_front]
+real_x = np.linspace(0, 1, len(pso.pareto_front))
+real_y = 1 - np.sqrt(real_x)
+plt.scatter(real_x, real_y, s=5, c='red')
+plt.scatter(pareto_x, pareto_y, s=5)
+
+if not os.path.exists('tmp/gu_zdt1'):
+    os.makedirs('tmp/gu_zdt1')
+plt.savefig('tmp/gu_zdt1/pf.png')
+plt.close()
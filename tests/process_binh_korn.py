@@ -0,0 +1,48 @@
+import patatune
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+lb = [0.0, 0.0]
+ub = [5.0, 3.0]
+
+num_agents = 100
+num_iterations = 100
+num_params = 2
+
+
+def f(params):
+    return [[4 * x**2 + 4 * y**2, (x - 5)**2 + (y - 5)**2] for x, y in params]
+
+
+def run(num_iterations):
+    objective = patatune.ProcessBatchObjective([f], batch_size=25, num_objectives=2, objective_names=['f1', 'f2'],
+                                               directions=['minimize', 'minimize'], max_workers=4)
+    pso = patatune.MOPSO(objective=objective, lower_bounds=lb, upper_bounds=ub,
+                         num_particles=num_agents,
+                         inertia_weight=0.5, cognitive_coefficient=1, social_coefficient=1,
+                         initial_particles_position='random', max_pareto_length=100)
+    pso.optimize(num_iterations)
+    pso.objective.close()
+    return pso
+
+
+if __name__ == '__main__':
+    patatune.FileManager.working_dir = "tmp/process_binh_korn"
+    patatune.FileManager.saving_enabled = True
+
+    # run the first half of the optimization
+    patatune.FileManager.loading_enabled = False
+    pso = run(num_iterations // 2)
+
+    # resume from the checkpoint, the objective function is sent again to new worker processes
+    patatune.FileManager.loading_enabled = True
+    pso = run(num_iterations)
+    print(pso.iteration, len(pso.pareto_front))
+
+    pareto_x = [particle.fitness[0] for particle in pso.pareto_front]
+    pareto_y = [particle.fitness[1] for particle in pso.pareto_front]
+    plt.scatter(pareto_x, pareto_y, s=5)
+    plt.xlim(0, 140)
+    plt.ylim(0, 70)
+    plt.savefig('tmp/process_binh_korn/checkpoint/pf.png')